@@ -0,0 +1,38 @@
+import argparse
+import time
+
+from services.auth import register
+from services.user import me
+from utils.generate_random import rnstr
+from utils.request import make_requests, request_spec, set_http2, close_sessions
+
+
+def run(user, requests, workers):
+    specs = [request_spec(me, user) for _ in range(requests)]
+    start = time.perf_counter()
+    responses = make_requests(specs, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for response in responses if response.status_code != 200)
+    return elapsed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare HTTP/1.1 and HTTP/2 throughput against the 4443 gateway.')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=32)
+    args = parser.parse_args()
+
+    password = 'password-' + rnstr(15)
+    response = register('bench-' + rnstr(10), password)
+    user = {'token': response.json['access'], 'password': password}
+
+    for name, enabled in (('HTTP/1.1', False), ('HTTP/2', True)):
+        set_http2(enabled)
+        close_sessions()
+        elapsed, failed = run(user, args.requests, args.workers)
+        print(f'{name}: {args.requests} requests in {elapsed:.2f}s => {args.requests / elapsed:.0f} req/s ({failed} failed)', flush=True)
+    close_sessions()
+
+
+if __name__ == '__main__':
+    main()
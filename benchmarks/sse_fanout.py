@@ -0,0 +1,149 @@
+import argparse
+import json
+import resource
+import time
+from threading import Event, Lock
+
+from services.auth import create_guest
+from services.sse import events
+from services.user import me
+from utils.config import SSE_CONNECT_TIMEOUT
+from utils.latency import Histogram, format_table, ms
+from utils.request import make_requests, request_spec
+from utils.sse_event import cfr
+from utils.sse_hub import SSEHub
+from utils.sse_parser import SSEParser
+
+
+class Listener:
+
+    def __init__(self, user, state):
+        self.user = user
+        self.state = state
+        self.parser = SSEParser()
+        self.received = {}
+        self.opened = False
+
+    def on_open(self, response):
+        self.opened = True
+        self.state.opened(response.status_code == 200)
+        return response.status_code == 200
+
+    def on_chunk(self, chunk):
+        received_at = time.monotonic()
+        for event, _, data, _ in self.parser.feed(chunk):
+            if event == 'ping':
+                continue
+            seq = json.loads(data).get('data', {}).get('benchmark')
+            self.received[seq] = received_at
+            self.state.delivered()
+        return False
+
+    def on_close(self):
+        if not self.opened:
+            self.opened = True
+            self.state.opened(False)
+
+
+class State:
+
+    def __init__(self, listeners):
+        self.lock = Lock()
+        self.pending_open = listeners
+        self.failed = 0
+        self.deliveries = 0
+        self.expected = 0
+        self.all_open = Event()
+        self.all_delivered = Event()
+
+    def opened(self, ok):
+        with self.lock:
+            self.pending_open -= 1
+            self.failed += not ok
+            if self.pending_open == 0:
+                self.all_open.set()
+
+    def delivered(self):
+        with self.lock:
+            self.deliveries += 1
+            if self.deliveries >= self.expected:
+                self.all_delivered.set()
+
+
+def create_users(n):
+    users = []
+    for response in make_requests(request_spec(create_guest) for _ in range(n)):
+        users.append({'token': response.json['access']})
+    for user, response in zip(users, make_requests(request_spec(me, user) for user in users)):
+        user['id'] = response.json['id']
+    return users
+
+
+def run(hub, listeners, rounds, event_code, timeout):
+    users = create_users(listeners)
+    state = State(listeners)
+
+    start = time.monotonic()
+    subscribers = [Listener(user, state) for user in users]
+    subscriptions = [
+        hub.subscribe({'Authorization': f'Bearer {s.user["token"]}', 'Content-Type': 'text/event-stream'}, s.on_open, s.on_chunk, s.on_close)
+        for s in subscribers
+    ]
+    state.all_open.wait(timeout)
+    connect_time = time.monotonic() - start
+
+    state.expected = (listeners - state.failed) * rounds
+    if state.expected == 0:
+        state.all_delivered.set()
+    ids = [user['id'] for user in users]
+    sent_at = {}
+    first_sent = time.monotonic()
+    for seq in range(rounds):
+        sent_at[seq] = time.monotonic()
+        events(users=ids[1:], user_to=users[0], data={'benchmark': seq}, event_code=event_code)
+    state.all_delivered.wait(timeout)
+
+    latency = Histogram()
+    last_delivery = 0.
+    last_received = first_sent
+    for seq, sent in sent_at.items():
+        arrivals = [s.received[seq] for s in subscribers if seq in s.received]
+        for received_at in arrivals:
+            latency.add(received_at - sent)
+        if arrivals:
+            last_delivery = max(last_delivery, max(arrivals) - sent)
+            last_received = max(last_received, max(arrivals))
+
+    for subscription in subscriptions:
+        subscription.cancel()
+    for subscription in subscriptions:
+        subscription.join()
+
+    elapsed = last_received - first_sent
+    return [
+        listeners, state.failed, f'{connect_time:.2f}', f'{state.deliveries}/{state.expected}',
+        ms(latency.percentile(50)), ms(latency.percentile(99)), ms(latency.max),
+        ms(last_delivery), f'{state.deliveries / elapsed:.0f}' if elapsed > 0 else '-',
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SSE fan-out through private/users/events/.')
+    parser.add_argument('--listeners', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--event-code', default=cfr)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--connect-timeout', type=float, default=SSE_CONNECT_TIMEOUT)
+    args = parser.parse_args()
+
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    hub = SSEHub(args.connect_timeout)
+    rows = [run(hub, n, args.rounds, args.event_code, args.timeout) for n in args.listeners]
+    header = ['listeners', 'failed', 'connect s', 'delivered', 'p50 ms', 'p99 ms', 'max ms', 'last delivery ms', 'events/s']
+    print(format_table(header, rows), flush=True)
+
+
+if __name__ == '__main__':
+    main()
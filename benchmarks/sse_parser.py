@@ -0,0 +1,60 @@
+import argparse
+import json
+import re
+import time
+
+from utils.sse_parser import SSEParser
+
+
+def make_stream(events, payload):
+    data = json.dumps({'event_code': 'lobby-message', 'data': {'content': 'x' * payload}})
+    return b''.join(f'id: {i}\nevent: lobby-message\ndata: {data}\n\n'.encode() for i in range(events))
+
+
+def chunks(stream, size):
+    return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+
+def parse_incremental(parts):
+    parser = SSEParser()
+    count = 0
+    for part in parts:
+        count += len(parser.feed(part))
+    return count
+
+
+def parse_regex(parts):
+    buff = None
+    count = 0
+    for part in parts:
+        line = part.decode()
+        if buff is not None:
+            line = buff + line
+            buff = None
+        if '\n\n' not in line:
+            buff = line
+            continue
+        count += len(re.findall(r'event: ([a-z0-9\-]+)\ndata: (.+)\n\n', line))
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SSE parser throughput micro-benchmark.')
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--payload', type=int, default=200)
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[64, 1024, 16384])
+    args = parser.parse_args()
+
+    stream = make_stream(args.events, args.payload)
+    for size in args.chunk_sizes:
+        parts = chunks(stream, size)
+        for name, parse in (('incremental', parse_incremental), ('regex', parse_regex)):
+            start = time.perf_counter()
+            count = parse(parts)
+            elapsed = time.perf_counter() - start
+            print(f'{name:<12} chunk={size:<6} {count} events in {elapsed * 1000:.1f} ms => '
+                  f'{len(stream) / elapsed / 1e6:.1f} MB/s, {count / elapsed:.0f} events/s', flush=True)
+
+
+if __name__ == '__main__':
+    main()
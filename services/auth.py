@@ -1,5 +1,5 @@
 from utils.generate_random import rnstr
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def register(username=None, password=None, data=None, method='POST'):
@@ -93,3 +93,11 @@ def refresh(token, data=None):
         token=token,
         data=data,
     )
+
+
+aregister = asynchronous(register)
+aregister_guest = asynchronous(register_guest)
+acreate_guest = asynchronous(create_guest)
+alogin = asynchronous(login)
+averify = asynchronous(verify)
+arefresh = asynchronous(refresh)
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def blocked_user(user, user_id=None, data=None, method: Literal['GET', 'POST'] = 'POST'):
@@ -31,3 +31,8 @@ def are_blocked(user1_id, user2_id):
         endpoint=f'private/users/blocked/{user1_id}/{user2_id}/',
         port=8005,
     )
+
+
+ablocked_user = asynchronous(blocked_user)
+aunblocked_user = asynchronous(unblocked_user)
+aare_blocked = asynchronous(are_blocked)
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def accept_chat(user, accept_chat_from: Literal['everyone', 'friend_only', 'none'] = 'everyone'):
@@ -45,3 +45,9 @@ def create_message(user, chat_id, message=None, data=None, method: Literal['GET'
         kwargs['endpoint'] = f'chat/{chat_id}/messages/'
 
     return make_request(**kwargs)
+
+
+aaccept_chat = asynchronous(accept_chat)
+acreate_chat = asynchronous(create_chat)
+arequest_chat_id = asynchronous(request_chat_id)
+acreate_message = asynchronous(create_message)
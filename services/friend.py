@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def friend_requests(sender, receiver=None, method: Literal['POST', 'GET'] = 'POST', data=None):
@@ -51,3 +51,16 @@ def create_friendship(user1, user2):
     response_request = friend_requests(user1, user2)
     response_accept = friend_request(response_request.json['id'], user2)
     return [response_request, response_accept]
+
+
+afriend_requests = asynchronous(friend_requests)
+aget_friend_requests_received = asynchronous(get_friend_requests_received)
+aget_friends = asynchronous(get_friends)
+afriend = asynchronous(friend)
+afriend_request = asynchronous(friend_request)
+
+
+async def acreate_friendship(user1, user2):
+    response_request = await afriend_requests(user1, user2)
+    response_accept = await afriend_request(response_request.json['id'], user2)
+    return [response_request, response_accept]
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def create_game(user1=None, user2=None, game_mode='duel', data=None, method: Literal['GET', 'POST', 'PATCH', 'DELETE'] = 'POST'):
@@ -65,3 +65,11 @@ def get_games(user):
         endpoint=f'game/matches/{user["id"]}/',
         token=user['token'],
     )
+
+
+acreate_game = asynchronous(create_game)
+ais_in_game = asynchronous(is_in_game)
+ascore = asynchronous(score)
+afinish_match = asynchronous(finish_match)
+aget_tournament = asynchronous(get_tournament)
+aget_games = asynchronous(get_games)
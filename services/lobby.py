@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def create_lobby(user, data=None, method: Literal['GET', 'POST', 'PATCH', 'DELETE'] = 'POST', game_mode='clash'):
@@ -54,3 +54,10 @@ def post_message(user, code, message=None, data=None):
         method='POST',
         data=data,
     )
+
+
+acreate_lobby = asynchronous(create_lobby)
+ajoin_lobby = asynchronous(join_lobby)
+aban_user = asynchronous(ban_user)
+ainvite_user = asynchronous(invite_user)
+apost_message = asynchronous(post_message)
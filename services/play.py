@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def play(user, game_mode: Literal['ranked', 'duel'] = 'duel', method: Literal['POST', 'DELETE'] = 'POST'):
@@ -9,3 +9,6 @@ def play(user, game_mode: Literal['ranked', 'duel'] = 'duel', method: Literal['P
         method=method,
         token=user['token'],
     )
+
+
+aplay = asynchronous(play)
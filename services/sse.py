@@ -1,4 +1,4 @@
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def events(user_to=None, users=None, request_data=None, data=None, event_code=None, kwargs=None):
@@ -20,3 +20,6 @@ def events(user_to=None, users=None, request_data=None, data=None, event_code=No
         data=request_data,
         port=8005,
     )
+
+
+aevents = asynchronous(events)
@@ -1,4 +1,4 @@
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def finish_match_stat(data=None):
@@ -57,3 +57,10 @@ def set_trophies(user, trophies):
         method='POST',
         data=data,
     )
+
+
+afinish_match_stat = asynchronous(finish_match_stat)
+afinish_tournament_stat = asynchronous(finish_tournament_stat)
+aget_stats = asynchronous(get_stats)
+aget_ranked_stats = asynchronous(get_ranked_stats)
+aset_trophies = asynchronous(set_trophies)
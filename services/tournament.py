@@ -1,7 +1,7 @@
 from typing import Literal
 
 from utils.generate_random import rnstr
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def create_tournament(user, data=None, method: Literal['GET', 'POST', 'PATCH', 'DELETE'] = 'POST', private=None, size=4):
@@ -64,3 +64,11 @@ def post_message(user, code, message=None, data=None):
         method='POST',
         data=data,
     )
+
+
+acreate_tournament = asynchronous(create_tournament)
+ajoin_tournament = asynchronous(join_tournament)
+asearch_tournament = asynchronous(search_tournament)
+aban_user = asynchronous(ban_user)
+ainvite_user = asynchronous(invite_user)
+apost_message = asynchronous(post_message)
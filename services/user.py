@@ -1,6 +1,6 @@
 from typing import Literal
 
-from utils.request import make_request
+from utils.request import make_request, asynchronous
 
 
 def get_user(user, user2_id):
@@ -57,3 +57,12 @@ def get_profile_pictures(user):
         endpoint='users/profile-pictures/',
         token=user['token'],
     )
+
+
+aget_user = asynchronous(get_user)
+ame = asynchronous(me)
+aget_data = asynchronous(get_data)
+aget_chat_data = asynchronous(get_chat_data)
+aget_game_data = asynchronous(get_game_data)
+aset_profile_pictures = asynchronous(set_profile_pictures)
+aget_profile_pictures = asynchronous(get_profile_pictures)
@@ -3,6 +3,7 @@ from random import randint
 
 from services.blocked import blocked_user, unblocked_user
 from utils.my_unittest import UnitTest
+from utils.request import make_requests, request_spec
 
 
 class Test01_Blocked(UnitTest):
@@ -10,10 +11,10 @@ class Test01_Blocked(UnitTest):
     def test_001_blocked(self):
         user1 = self.user()
         n = randint(1, 10)
-        users = [self.user() for _ in range(n)]
+        users = self.users(n)
 
-        for user_tmp in users:
-            self.assertResponse(blocked_user(user1, user_tmp['id']), 201)
+        for response in make_requests(request_spec(blocked_user, user1, user_tmp['id']) for user_tmp in users):
+            self.assertResponse(response, 201)
         self.assertResponse(blocked_user(user1, method='GET'), 200, count=n)
         self.assertThread(user1, *users)
 
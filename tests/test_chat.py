@@ -111,7 +111,7 @@ class Test03_GetChat(UnitTest):
     def test_001_get_chats(self):
         user1 = self.user()
         ct = 5
-        users = [self.user() for _ in range(ct)]
+        users = self.users(ct)
 
         self.assertResponse(create_chat(user1, method='GET'), 200, count=0)
 
@@ -291,7 +291,7 @@ class Test04_Messages(UnitTest):
 
     def test_007_get_chat_sort_by_last_update(self):
         user1 = self.user()
-        users = [self.user() for _ in range(5)]
+        users = self.users(5)
         chat_id = None
         tmp_chat_id = None
 
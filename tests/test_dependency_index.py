@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from utils.dependency_index import build_index, dependencies, affected
+
+FILES = {
+    'services/user.py': 'from utils.request import make_request\n',
+    'services/chat.py': 'from utils.request import make_request\n',
+    'utils/request.py': 'import json\n',
+    'utils/generate_random.py': 'import random\n',
+    'tests/test_user.py': 'import unittest\n\nfrom services.user import me\n',
+    'tests/test_chat.py': 'from services import chat\nfrom utils.generate_random import rnstr\n',
+}
+
+
+class Test01_DependencyIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for path, source in FILES.items():
+            os.makedirs(os.path.join(self.root, os.path.dirname(path)), exist_ok=True)
+            with open(os.path.join(self.root, path), 'w') as f:
+                f.write(source)
+
+    def test_001_transitive_dependencies(self):
+        index = build_index(self.root, ['tests/test_user.py'])
+
+        self.assertEqual({'tests/test_user.py', 'services/user.py', 'utils/request.py'}, dependencies(index, 'tests/test_user.py'))
+
+    def test_002_affected_tests(self):
+        tests = ['tests/test_chat.py', 'tests/test_user.py']
+
+        self.assertEqual(tests, affected(self.root, tests, {'utils/request.py'}))
+        self.assertEqual(['tests/test_chat.py'], affected(self.root, tests, {'utils/generate_random.py'}))
+        self.assertEqual(['tests/test_user.py'], affected(self.root, tests, {'tests/test_user.py'}))
+        self.assertEqual([], affected(self.root, tests, {'services/game.py'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ from services.play import play
 from services.user import me
 from utils.config import MAX_SCORE
 from utils.my_unittest import UnitTest
+from utils.request import make_requests, request_spec
 from utils.sse_event import ppu, afr, rfr, df, cfr, du, rejfr, gs, lj, lup
 
 
@@ -19,7 +20,9 @@ class Test01_Friend(UnitTest):
         user1 = self.user([afr, ppu])
         user2 = self.user([rfr, ppu])
 
-        self.assertFriendResponse(create_friendship(user1, user2))
+        responses = create_friendship(user1, user2)
+        self.assertFriendResponse(responses)
+        self.delivery(responses[0], rfr, user2)
         response = self.assertResponse(get_friends(user1), 200, count=1)
         self.assertEqual(response['results'][0]['friend']['username'], user2['username'])
         response = self.assertResponse(get_friends(user2), 200, count=1)
@@ -29,7 +32,9 @@ class Test01_Friend(UnitTest):
         user1 = self.user([rfr, ppu])
         user2 = self.user([afr, ppu])
 
-        self.assertFriendResponse(create_friendship(user2, user1))
+        responses = create_friendship(user2, user1)
+        self.assertFriendResponse(responses)
+        self.delivery(responses[0], rfr, user1)
         response = self.assertResponse(get_friends(user1), 200, count=1)
         self.assertEqual(response['results'][0]['friend']['username'], user2['username'])
         response = self.assertResponse(get_friends(user2), 200, count=1)
@@ -44,10 +49,12 @@ class Test01_Friend(UnitTest):
 
     def test_003_get_friends(self):
         user1 = self.user([afr, ppu, afr, afr, afr, afr, afr, afr])
-        users = [self.user([rfr, ppu]) for _ in range(7)]
+        users = self.users(7, [rfr, ppu])
 
         for user_tmp in users:
-            self.assertFriendResponse(create_friendship(user1, user_tmp))
+            responses = create_friendship(user1, user_tmp)
+            self.assertFriendResponse(responses)
+            self.delivery(responses[0], rfr, user_tmp)
 
         self.assertResponse(get_friends(user1), 200, count=7)
         self.assertThread(user1, *users)
@@ -55,8 +62,8 @@ class Test01_Friend(UnitTest):
     def test_004_get_friends_is_online(self):
         user1 = self.user([afr, ppu] + [afr] * 4)
         user2 = self.user([rfr, ppu])
-        users_online = [self.user([rfr, ppu]) for _ in range(2)]
-        users = [self.user([rfr, ppu]) for _ in range(2)]
+        users_online = self.users(2, [rfr, ppu])
+        users = self.users(2, [rfr, ppu])
 
         self.assertFriendResponse(create_friendship(user1, user2))
         for user_tmp in users:
@@ -150,7 +157,9 @@ class Test02_FriendRequest(UnitTest):
         user1 = self.user()
         user2 = self.user([rfr])
 
-        friend_request_id = self.assertResponse(friend_requests(user1, user2), 201, get_field=True)
+        response = friend_requests(user1, user2)
+        friend_request_id = self.assertResponse(response, 201, get_field=True)
+        self.delivery(response, rfr, user2)
 
         self.assertResponse(get_friend_requests_received(user2), 200, count=1)
         self.assertResponse(friend_requests(user1, method='GET'), 200, count=1)
@@ -217,7 +226,9 @@ class Test02_FriendRequest(UnitTest):
         user2 = self.user([rfr])
         user3 = self.user()
 
-        friend_request_id = self.assertResponse(friend_requests(user1, user2), 201, get_field=True)
+        response = friend_requests(user1, user2)
+        friend_request_id = self.assertResponse(response, 201, get_field=True)
+        self.delivery(response, rfr, user2)
         self.assertResponse(friend_request(friend_request_id, user3), 404, {'detail': 'Friend request not found.'})
         self.assertThread(user1, user2, user3)
 
@@ -227,7 +238,9 @@ class Test02_FriendRequest(UnitTest):
         user3 = self.user([rfr, cfr])
         user4 = self.user([rfr, du])
 
-        friend_request_id = self.assertResponse(friend_requests(user1, user2), 201, get_field=True)
+        response = friend_requests(user1, user2)
+        friend_request_id = self.assertResponse(response, 201, get_field=True)
+        self.delivery(response, rfr, user2)
         self.assertResponse(friend_request(friend_request_id, user2, 'DELETE'), 204)
         self.assertResponse(friend_request(friend_request_id, user1, 'GET'), 404, {'detail': 'Friend request not found.'})
 
@@ -267,7 +280,9 @@ class Test02_FriendRequest(UnitTest):
         user1 = self.user([afr, ppu])
         user2 = self.user([rfr, ppu])
 
-        friend_request_id = self.assertResponse(friend_requests(user1, user2), 201, get_field=True)
+        response = friend_requests(user1, user2)
+        friend_request_id = self.assertResponse(response, 201, get_field=True)
+        self.delivery(response, rfr, user2)
         self.assertResponse(friend_request(friend_request_id, user2), 201, get_field=True)
         self.assertResponse(friend_request(friend_request_id, user1, 'GET'), 404, {'detail': 'Friend request not found.'})
         self.assertResponse(friend_request(friend_request_id, user2, 'GET'), 404, {'detail': 'Friend request not found.'})
@@ -277,7 +292,9 @@ class Test02_FriendRequest(UnitTest):
         user1 = self.user()
         user2 = self.user([rfr])
 
-        friend_request_id = self.assertResponse(friend_requests(user1, user2), 201, get_field=True)
+        response = friend_requests(user1, user2)
+        friend_request_id = self.assertResponse(response, 201, get_field=True)
+        self.delivery(response, rfr, user2)
         self.assertResponse(friend_request(friend_request_id, user1), 403, {'detail': 'You cannot accept your own friend request.'})
         self.assertThread(user1, user2)
 
@@ -299,13 +316,13 @@ class Test02_FriendRequest(UnitTest):
         n = 4
         user1 = self.user([rfr] * (n + 1) + [cfr])
         user2 = self.user()
-        users = [self.user() for _ in range(n)]
+        users = self.users(n)
 
         self.assertEqual(0, self.assertResponse(me(user1), 200, get_field='notifications')['friend_requests'])
 
         friend_request_id = self.assertResponse(friend_requests(user2, user1), 201, get_field=True)
-        for tmp_user in users:
-            self.assertResponse(friend_requests(tmp_user, user1), 201)
+        for response in make_requests(request_spec(friend_requests, tmp_user, user1) for tmp_user in users):
+            self.assertResponse(response, 201)
 
         self.assertResponse(get_friend_requests_received(user2), 200)
         self.assertEqual(n + 1, self.assertResponse(me(user1), 200, get_field='notifications')['friend_requests'])
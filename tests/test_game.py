@@ -21,7 +21,8 @@ class Test01_Game(UnitTest):
         user2 = self.user([gs])
 
         self.assertResponse(create_game(user1, user2), 201)
-        time.sleep(1)
+        self.wait_for_events(user1, [gs])
+        self.wait_for_events(user2, [gs])
         self.assertThread(user1, user2)
 
     def test_002_already_in_game(self):
@@ -88,7 +89,7 @@ class Test01_Game(UnitTest):
     def test_009_get_games(self):
         n = random.randint(2, 9)
         user1 = self.user([gs] * n)
-        users = [self.user([gs]) for _ in range(n)]
+        users = self.users(n, [gs])
 
         for u in users:
             self.assertResponse(create_game(user1, u), 201)
@@ -246,7 +247,8 @@ class Test04_Tournament(UnitTest):
         self.assertResponse(join_tournament(user3, code), 201)
         self.assertResponse(join_tournament(user4, code), 201)
 
-        time.sleep(5)
+        for u in (user1, user2, user3, user4):
+            self.wait_for_events(u, [ts, gs])
 
         for _ in range(MAX_SCORE):
             self.assertResponse(score(user1['id']), 200)
@@ -254,7 +256,8 @@ class Test04_Tournament(UnitTest):
         for _ in range(MAX_SCORE):
             self.assertResponse(score(user2['id']), 200)
 
-        time.sleep(5)
+        for u in (user1, user2):
+            self.wait_for_events(u, [tmf, tmf, gs])
 
         self.assertResponse(score(user1['id']), 200)
         self.assertResponse(score(user2['id']), 200)
@@ -262,7 +265,7 @@ class Test04_Tournament(UnitTest):
         for _ in range(MAX_SCORE - 1):
             self.assertResponse(score(user1['id']), 200)
 
-        time.sleep(5)
+        self.wait_for_events(user1, [tmf, tf])
 
         response = self.assertResponse(get_games(user1), 200, count=2)
         self.assertResponse(get_tournament(response['results'][0]['tournament_id'], user1), 200)
@@ -0,0 +1,37 @@
+import base64
+import json
+import unittest
+
+from utils.jwt import decode_claims, user_from_claims
+
+
+def make_token(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b'=').decode()
+    return f'eyJhbGciOiJIUzI1NiJ9.{payload}.signature'
+
+
+class Test01_JWT(unittest.TestCase):
+
+    def test_001_decode_claims(self):
+        self.assertEqual({'user_id': 42, 'token_type': 'access'}, decode_claims(make_token({'user_id': 42, 'token_type': 'access'})))
+
+    def test_002_invalid_token(self):
+        self.assertIsNone(decode_claims('not-a-token'))
+        self.assertIsNone(decode_claims('a.!!!.c'))
+        self.assertIsNone(decode_claims(None))
+
+    def test_003_user_from_claims(self):
+        token = make_token({'user_id': '7', 'username': 'user-abc', 'is_guest': False})
+
+        self.assertEqual({'id': 7, 'username': 'user-abc', 'is_guest': False}, user_from_claims(token))
+
+    def test_004_known_fields_complete_claims(self):
+        token = make_token({'user_id': 7})
+
+        self.assertEqual({'id': 7, 'username': 'user-abc', 'is_guest': False}, user_from_claims(token, 'user-abc', False))
+        self.assertIsNone(user_from_claims(token, None, True))
+        self.assertIsNone(user_from_claims(make_token({'username': 'user-abc'}), 'user-abc', False))
+
+
+if __name__ == '__main__':
+    unittest.main()
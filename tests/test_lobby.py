@@ -93,7 +93,7 @@ class Test02_ErrorJoinLobby(UnitTest):
 
     def test_007_blocked_user_cannot_join(self):
         user1 = self.user()
-        users = [self.user() for _ in range(30)]
+        users = self.users(30)
 
         for u in users:
             self.assertResponse(blocked_user(user1, u['id']), 201)
@@ -18,8 +18,9 @@ class Test01_Play(UnitTest):
         user2 = self.user([gs])
 
         self.assertResponse(play(user1), 201)
-        self.assertResponse(play(user2), 201)
-        time.sleep(1)
+        response = play(user2)
+        self.assertResponse(response, 201)
+        self.delivery(response, gs, user1, user2)
         self.assertThread(user1, user2)
 
     def test_002_play_ranked(self):
@@ -27,8 +28,9 @@ class Test01_Play(UnitTest):
         user2 = self.user([gs])
 
         self.assertResponse(play(user1, game_mode='ranked'), 201)
-        self.assertResponse(play(user2, game_mode='ranked'), 201)
-        time.sleep(1)
+        response = play(user2, game_mode='ranked')
+        self.assertResponse(response, 201)
+        self.delivery(response, gs, user1, user2)
         self.assertThread(user1, user2)
 
     def test_003_play_clash(self):
@@ -54,7 +56,8 @@ class Test01_Play(UnitTest):
         self.assertResponse(join_lobby(user5, code, data={'is_ready': True}), 200)
         self.assertResponse(join_lobby(user6, code, data={'is_ready': True}), 200)
 
-        time.sleep(2)
+        for user_tmp in (user1, user2, user3, user4, user5, user6):
+            self.wait_for_events(user_tmp, [gs])
         self.assertThread(user1, user2, user3, user4, user5, user6)
 
     def test_004_play_custom_game(self):
@@ -79,7 +82,8 @@ class Test01_Play(UnitTest):
         self.assertResponse(join_lobby(user5, code, data={'is_ready': True}), 200)
         self.assertResponse(join_lobby(user6, code, data={'is_ready': True}), 200)
 
-        time.sleep(2)
+        for user_tmp in (user1, user2, user3, user4, user5, user6):
+            self.wait_for_events(user_tmp, [gs])
         self.assertThread(user1, user2, user3, user4, user5, user6)
 
     def test_005_play_duel_guest(self):
@@ -87,8 +91,9 @@ class Test01_Play(UnitTest):
         user2 = self.user([gs], guest=True)
 
         self.assertResponse(play(user1), 201)
-        self.assertResponse(play(user2), 201)
-        time.sleep(1)
+        response = play(user2)
+        self.assertResponse(response, 201)
+        self.delivery(response, gs, user1, user2)
         self.assertThread(user1, user2)
 
 
@@ -104,7 +109,7 @@ class Test02_PlayError(UnitTest):
 
     def test_002_already_in_tournament(self):
         user1 = self.user([tj, tj, tj, ts])
-        users = [self.user([tj] * (2 - i) + [ts]) for i in range(3)]
+        users = self.users(3, lambda i: [tj] * (2 - i) + [ts])
 
         code = self.assertResponse(create_tournament(user1), 201, get_field='code')
 
@@ -186,7 +191,8 @@ class Test02_PlayError(UnitTest):
         self.assertResponse(is_in_game(user1), 404)
         self.assertResponse(play(user3, game_mode='ranked'), 201)
         self.assertResponse(play(user4, game_mode='ranked'), 201)
-        time.sleep(1)
+        for user_tmp in (user1, user2, user3, user4):
+            self.wait_for_events(user_tmp, [gs])
         self.assertThread(user1, user2, user3, user4)
 
     def test_009_ranked_trophies_closer(self):
@@ -206,7 +212,8 @@ class Test02_PlayError(UnitTest):
         self.assertResponse(is_in_game(user1), 404)
         self.assertResponse(play(user3, game_mode='ranked'), 201)
         self.assertResponse(play(user4, game_mode='ranked'), 201)
-        time.sleep(1)
+        for user_tmp in (user1, user2, user3, user4):
+            self.wait_for_events(user_tmp, [gs])
         self.assertThread(user1, user2, user3, user4)
 
     def test_010_blocked_user(self):
@@ -242,7 +249,8 @@ class Test02_PlayError(UnitTest):
         code = self.assertResponse(create_lobby(user7), 201, get_field='code')
         self.assertResponse(join_lobby(user7, code, data={'is_ready': True}), 200)
 
-        time.sleep(2)
+        for user_tmp in (user1, user2, user4, user5, user6, user7):
+            self.wait_for_events(user_tmp, [gs])
 
         self.assertResponse(is_in_game(user1), 200)
         self.assertResponse(is_in_game(user3), 404)
@@ -284,7 +292,8 @@ class Test02_PlayError(UnitTest):
         code = self.assertResponse(create_lobby(user7), 201, get_field='code')
         self.assertResponse(join_lobby(user7, code, data={'is_ready': True}), 200)
 
-        time.sleep(2)
+        for user_tmp in (user1, user2, user4, user5, user6, user7):
+            self.wait_for_events(user_tmp, [gs])
 
         self.assertResponse(is_in_game(user1), 200)
         self.assertResponse(is_in_game(user3), 404)
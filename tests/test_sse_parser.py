@@ -0,0 +1,167 @@
+import time
+import unittest
+from unittest import mock
+
+from utils.event_log import EventLog
+from utils.my_unittest import UnitTest
+from utils.request import RequestResult
+from utils.sse_event import lj, ll, lup, gs
+from utils.sse_parser import SSEParser
+
+
+class Test01_SSEParser(unittest.TestCase):
+
+    def test_001_single_event(self):
+        parser = SSEParser()
+
+        self.assertEqual([('game-start', None, '{"id": 1}', False)], parser.feed(b'event: game-start\ndata: {"id": 1}\n\n'))
+
+    def test_002_split_across_chunks(self):
+        parser = SSEParser()
+        stream = b'event: lobby-join\ndata: {"a": 1}\n\nevent: lobby-leave\ndata: {"b": 2}\n\n'
+
+        records = []
+        for i in range(len(stream)):
+            records += parser.feed(stream[i:i + 1])
+        self.assertEqual([('lobby-join', None, '{"a": 1}', False), ('lobby-leave', None, '{"b": 2}', False)], records)
+
+    def test_003_multi_line_data(self):
+        parser = SSEParser()
+
+        self.assertEqual([('message', None, 'line1\nline2', False)], parser.feed(b'data: line1\ndata: line2\n\n'))
+
+    def test_004_id_and_retry(self):
+        parser = SSEParser()
+
+        records = parser.feed(b'id: 41\nretry: 3000\nevent: ping\ndata: {}\n\nevent: ping\ndata: {}\n\n')
+        self.assertEqual([('ping', '41', '{}', True), ('ping', '41', '{}', False)], records)
+        self.assertEqual('41', parser.last_id)
+        self.assertEqual(3000, parser.retry)
+
+    def test_005_crlf_and_comments(self):
+        parser = SSEParser()
+
+        self.assertEqual([('tournament-join', None, 'x', False)], parser.feed(b': keep-alive\r\nevent: tournament-join\r\ndata: x\r\n\r\n'))
+
+    def test_006_no_data_is_not_dispatched(self):
+        parser = SSEParser()
+
+        self.assertEqual([], parser.feed(b'event: game-start\n\n'))
+        self.assertEqual([('message', None, 'x', False)], parser.feed(b'data: x\n\n'))
+
+    def test_007_incomplete_event_is_kept(self):
+        parser = SSEParser()
+
+        self.assertEqual([], parser.feed(b'event: delete-user\ndata: {"a"'))
+        self.assertEqual([('delete-user', None, '{"a": 1}', False)], parser.feed(b': 1}\n\n'))
+
+    def test_008_sticky_id_is_flagged_only_on_its_own_event(self):
+        parser = SSEParser()
+        stream = b'id: 5\nevent: lobby-join\ndata: {}\n\nevent: lobby-leave\ndata: {}\n\nevent: ping\ndata: {}\n\n'
+
+        self.assertEqual([('lobby-join', '5', '{}', True), ('lobby-leave', '5', '{}', False), ('ping', '5', '{}', False)], parser.feed(stream))
+
+    def test_009_bare_cr(self):
+        parser = SSEParser()
+
+        self.assertEqual([('lobby-join', None, 'x', False), ('lobby-leave', None, 'y', False)], parser.feed(b': hi\revent: lobby-join\rdata: x\r\revent: lobby-leave\rdata: y\r\r'))
+
+    def test_010_crlf_split_across_chunks(self):
+        parser = SSEParser()
+        stream = b'event: lobby-join\r\ndata: {"a": 1}\r\n\r\nevent: lobby-leave\r\ndata: {"b": 2}\r\n\r\n'
+
+        records = []
+        for i in range(len(stream)):
+            records += parser.feed(stream[i:i + 1])
+        self.assertEqual([('lobby-join', None, '{"a": 1}', False), ('lobby-leave', None, '{"b": 2}', False)], records)
+        self.assertEqual([], parser.feed(b''))
+
+
+def sse_user():
+    user = {'username': 'user'}
+    UnitTest._init_sse_user(user, None)
+    return user
+
+
+def chunk(event_code, event_id=None):
+    line = f'id: {event_id}\n' if event_id is not None else ''
+    return f'{line}event: {event_code}\ndata: {{"event_code": "{event_code}", "data": {{}}}}\n\n'.encode()
+
+
+class Test02_SSEDeduplication(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict('utils.my_unittest._sse_stats', {'reconnects': 0, 'lost': 0, 'jumps': 0, 'duplicates': 0})
+        self.stats = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_001_events_without_id_are_kept(self):
+        test, user = UnitTest(), sse_user()
+
+        test._on_sse_chunk(user, chunk(lj, 5) + chunk(ll) + b'event: ping\ndata: {}\n\n' + chunk(lj), False)
+        self.assertEqual([lj, ll, lj], user['thread_assertion'][:])
+        self.assertEqual(0, user['thread_duplicates'])
+
+    def test_002_replayed_ids_are_dropped(self):
+        test, user = UnitTest(), sse_user()
+
+        test._on_sse_chunk(user, chunk(lj, 5) + chunk(ll, 6), False)
+        user['thread_resumed'] = True
+        test._on_sse_chunk(user, chunk(ll, 6) + chunk(lup) + chunk(lj, 9), False)
+        self.assertEqual([lj, ll, lup, lj], user['thread_assertion'][:])
+        self.assertEqual(1, user['thread_duplicates'])
+        self.assertEqual(0, user['thread_lost'])
+        self.assertEqual(1, user['thread_jumps'])
+        self.assertEqual({'reconnects': 0, 'lost': 0, 'jumps': 1, 'duplicates': 1}, self.stats)
+
+    def test_003_dense_ids_count_lost_events(self):
+        test, user = UnitTest(), sse_user()
+
+        with mock.patch('utils.my_unittest.SSE_DENSE_IDS', True):
+            test._on_sse_chunk(user, chunk(lj, 5), False)
+            user['thread_resumed'] = True
+            test._on_sse_chunk(user, chunk(ll, 8), False)
+        self.assertEqual([lj, ll], user['thread_assertion'][:])
+        self.assertEqual(2, user['thread_lost'])
+        self.assertEqual(0, user['thread_jumps'])
+        self.assertEqual({'reconnects': 0, 'lost': 2, 'jumps': 0, 'duplicates': 0}, self.stats)
+
+
+class Test03_Delivery(unittest.TestCase):
+
+    def test_001_first_event_since(self):
+        events = EventLog()
+        events.append(lj, 1.0)
+        events.append(gs, 2.0)
+        events.append(gs, 5.0)
+
+        self.assertEqual(2.0, events.first(gs, 0))
+        self.assertEqual(5.0, events.first(gs, 3))
+        self.assertIsNone(events.first(gs, 6))
+        self.assertIsNone(events.first(lj, 2))
+
+    def test_002_delivery_is_measured_from_the_trigger(self):
+        test, user = UnitTest(), sse_user()
+        trigger = RequestResult(201)
+        trigger.sent_at = time.monotonic()
+        user['thread_assertion'].append(gs, trigger.sent_at - 1)
+        test._on_sse_chunk(user, chunk(gs), False)
+
+        with mock.patch('utils.my_unittest.record_delivery') as record_delivery:
+            latencies = test.delivery(trigger, gs, user)
+        self.assertEqual(user['thread_assertion'].timestamps[1] - trigger.sent_at, latencies[0])
+        record_delivery.assert_called_once_with(gs, latencies[0])
+
+    def test_003_event_before_the_trigger_is_not_delivered(self):
+        test, user = UnitTest(), sse_user()
+        trigger = RequestResult(201)
+        trigger.sent_at = time.monotonic()
+        user['thread_assertion'].append(gs, trigger.sent_at - 1)
+
+        with mock.patch('utils.my_unittest.record_delivery') as record_delivery:
+            self.assertRaises(AssertionError, test.delivery, trigger, gs, user, timeout=0)
+        record_delivery.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
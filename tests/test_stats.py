@@ -107,7 +107,8 @@ class Test02_Stats(UnitTest):
         self.assertResponse(join_tournament(user3, code), 201)
         self.assertResponse(join_tournament(user4, code), 201)
 
-        time.sleep(5)
+        for user_tmp in (user1, user2, user3, user4):
+            self.wait_for_events(user_tmp, [ts, gs])
 
         for _ in range(MAX_SCORE):
             self.assertResponse(score(user1['id']), 200)
@@ -66,27 +66,30 @@ class Test02_ErrorTournament(UnitTest):
     def test_003_already_started_not_full(self):
         user1 = self.user([tj] * 6 + [tsa, ts])
         user2 = self.user()
-        users = [self.user([tj] * (5 - i) + [tsa, ts, gs]) for i in range(6)]
+        users = self.users(6, lambda i: [tj] * (5 - i) + [tsa, ts, gs])
 
         self.assertResponse(set_trophies(user1, 1), 201)
         code = self.assertResponse(create_tournament(user1, size=8), 201, get_field='code')
 
         for user_tmp in users:
             self.assertResponse(join_tournament(user_tmp, code), 201)
-        time.sleep(30)
+        self.wait_for_events(user1, [ts], timeout=40)
         self.assertResponse(join_tournament(user2, code), 403, {'detail': 'Tournament already started.'})
+        for user_tmp in users:
+            self.wait_for_events(user_tmp, [ts, gs])
         self.assertThread(user1, user2, *users)
 
     def test_004_already_started(self):
         user1 = self.user([tj] * 3 + [ts, gs])
         user2 = self.user()
-        users = [self.user([tj] * (2 - i) + [ts, gs]) for i in range(3)]
+        users = self.users(3, lambda i: [tj] * (2 - i) + [ts, gs])
 
         code = self.assertResponse(create_tournament(user1), 201, get_field='code')
 
         for user_tmp in users:
             self.assertResponse(join_tournament(user_tmp, code), 201)
-        time.sleep(5)
+        for user_tmp in (user1, *users):
+            self.wait_for_events(user_tmp, [ts, gs])
         self.assertResponse(join_tournament(user2, code), 403, {'detail': 'Tournament already started.'})
         self.assertThread(user1, user2, *users)
 
@@ -294,7 +297,7 @@ class Test06_LeaveTournament(UnitTest):
 
     def test_001_leave_tournament_then_destroy(self):
         user1 = self.user([tj, tj])
-        users = [self.user([tj] * (1 - i) + [tl] * (i + 1)) for i in range(2)]
+        users = self.users(2, lambda i: [tj] * (1 - i) + [tl] * (i + 1))
 
         response = self.assertResponse(create_tournament(user1), 201)
         code = response['code']
@@ -454,7 +457,7 @@ class Test07_GetTournament(UnitTest):
         user1 = self.user()
         user2 = self.user()
         name = rnstr()
-        users = [self.user() for _ in range(5)]
+        users = self.users(5)
 
         for user_tmp in users:
             self.assertResponse(create_tournament(user_tmp, data={'name': 'Tournoi ' + name + rnstr()}), 201)
@@ -606,16 +609,18 @@ class Test09_StartTournament(UnitTest):
         self.assertThread(user1, user2, user3, user4)
 
     def test_002_start_tournament_80(self):
-        users = [self.user([tj] * (6 - i) + [tsa, tj, ts, gs]) for i in range(7)]
+        users = self.users(7, lambda i: [tj] * (6 - i) + [tsa, tj, ts, gs])
         user1 = self.user([ts, gs])
 
         code = self.assertResponse(create_tournament(users[0], size=8), 201, get_field='code')
         for u in users[1:]:
             self.assertResponse(join_tournament(u, code), 201)
 
-        time.sleep(5)
+        for u in users:
+            self.wait_for_events(u, [tsa])
         self.assertResponse(join_tournament(user1, code), 201)
-        time.sleep(5)
+        for u in (user1, *users):
+            self.wait_for_events(u, [ts, gs])
         self.assertThread(user1, *users)
 
     def test_003_cancel_start(self):
@@ -635,9 +640,11 @@ class Test09_StartTournament(UnitTest):
         self.assertResponse(join_tournament(user6, code), 201)
         self.assertResponse(join_tournament(user7, code), 201)
 
-        time.sleep(2)
+        for u in (user1, user2, user3, user4, user5, user6, user7):
+            self.wait_for_events(u, [tsa])
         self.assertResponse(join_tournament(user7, code, method='DELETE'), 204)
-        time.sleep(2)
+        for u in (user1, user2, user3, user4, user5, user6):
+            self.wait_for_events(u, [tl, 'tournament-start-cancel'])
 
         self.assertThread(user1, user2, user3, user4, user5, user6, user7)
 
@@ -652,7 +659,8 @@ class Test09_StartTournament(UnitTest):
         self.assertResponse(join_tournament(user3, code), 201)
         self.assertResponse(join_tournament(user4, code), 201)
 
-        time.sleep(5)
+        for u in (user1, user2, user3, user4):
+            self.wait_for_events(u, [ts, gs])
         self.assertResponse(ban_user(user1, user4, code), 403)
 
         self.assertThread(user1, user2, user3, user4)
@@ -668,7 +676,8 @@ class Test09_StartTournament(UnitTest):
         self.assertResponse(join_tournament(user3, code), 201)
         self.assertResponse(join_tournament(user4, code), 201)
 
-        time.sleep(5)
+        for u in (user1, user2, user3, user4):
+            self.wait_for_events(u, [ts, gs])
         self.assertResponse(invite_user(user1, user4, code), 403)
 
         self.assertThread(user1, user2, user3, user4)
@@ -1,2 +1,27 @@
+import os
+
 MAX_SCORE = 3
 LONG_QUERY = 'safdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdifsafdsfsjfojsifjiosdajfiosdjofjsdiajfisdjoifjsdif'
+
+POOL_SIZE = int(os.environ.get('API_POOL_SIZE', 10))
+ASYNC_POOL_SIZE = int(os.environ.get('API_ASYNC_POOL_SIZE', 100))
+BATCH_WORKERS = int(os.environ.get('API_BATCH_WORKERS', 16))
+HTTP2 = os.environ.get('API_HTTP2', '0') == '1'
+LATENCY_REPORT = os.environ.get('API_LATENCY_REPORT', '1') == '1'
+LOG_LEVEL = os.environ.get('API_LOG_LEVEL', 'failures')
+LOG_BUFFER_SIZE = int(os.environ.get('API_LOG_BUFFER_SIZE', 2000))
+SSE_CONNECT_TIMEOUT = float(os.environ.get('API_SSE_CONNECT_TIMEOUT', 5))
+SSE_HUB = os.environ.get('API_SSE_HUB', '0') == '1'
+SSE_CHECK_WORKERS = int(os.environ.get('API_SSE_CHECK_WORKERS', 8))
+SSE_RECONNECT_ATTEMPTS = int(os.environ.get('API_SSE_RECONNECT_ATTEMPTS', 5))
+SSE_RECONNECT_DELAY = float(os.environ.get('API_SSE_RECONNECT_DELAY', 0.5))
+SSE_RECONNECT_MAX_DELAY = float(os.environ.get('API_SSE_RECONNECT_MAX_DELAY', 10))
+SSE_PAYLOAD_RING = int(os.environ.get('API_SSE_PAYLOAD_RING', 0))
+SSE_DENSE_IDS = os.environ.get('API_SSE_DENSE_IDS', '0') == '1'
+USER_POOL_SIZE = int(os.environ.get('API_USER_POOL_SIZE', 8))
+USER_POOL_WORKERS = int(os.environ.get('API_USER_POOL_WORKERS', 2))
+JWT_CLAIMS = os.environ.get('API_JWT_CLAIMS', '1') == '1'
+RUNNER_JOBS = int(os.environ.get('API_RUNNER_JOBS', 4))
+TIMINGS_FILE = os.environ.get('API_TIMINGS_FILE', '.test_timings.json')
+TRACE_DIR = os.environ.get('API_TRACE_DIR', '')
+USER_POOL_MAX_AGE = float(os.environ.get('API_USER_POOL_MAX_AGE', 120))
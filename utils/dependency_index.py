@@ -0,0 +1,65 @@
+import ast
+import os
+import subprocess
+
+
+def _resolve(root, module):
+    path = os.path.join(root, *module.split('.'))
+    for candidate in (path + '.py', os.path.join(path, '__init__.py')):
+        if os.path.isfile(candidate):
+            return os.path.relpath(candidate, root)
+    return None
+
+
+def imports(root, path):
+    with open(os.path.join(root, path)) as f:
+        tree = ast.parse(f.read(), path)
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f'{node.module}.{alias.name}' for alias in node.names]
+        else:
+            continue
+        for name in names:
+            resolved = _resolve(root, name)
+            if resolved is not None:
+                found.add(resolved)
+    return found
+
+
+def build_index(root, files):
+    index = {}
+    pending = list(files)
+    while pending:
+        path = pending.pop()
+        if path in index:
+            continue
+        index[path] = imports(root, path)
+        pending += index[path] - index.keys()
+    return index
+
+
+def dependencies(index, path):
+    seen = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending += index.get(current, ())
+    return seen
+
+
+def affected(root, test_files, changed):
+    index = build_index(root, test_files)
+    changed = set(changed)
+    return [path for path in test_files if dependencies(index, path) & changed]
+
+
+def changed_files(root, ref='HEAD'):
+    diff = subprocess.run(['git', 'diff', '--name-only', '--relative', ref], cwd=root, capture_output=True, text=True, check=True)
+    untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'], cwd=root, capture_output=True, text=True, check=True)
+    return {os.path.normpath(path) for path in (diff.stdout + untracked.stdout).split() if path.endswith('.py')}
@@ -0,0 +1,39 @@
+from array import array
+from collections import deque
+
+from utils.sse_event import EVENT_CODES, event_id
+
+
+class EventLog:
+
+    def __init__(self, payloads=0):
+        self.codes = array('H')
+        self.timestamps = array('d')
+        self.payloads = deque(maxlen=payloads) if payloads else None
+
+    def append(self, code, timestamp, payload=None):
+        self.codes.append(event_id(code))
+        self.timestamps.append(timestamp)
+        if self.payloads is not None:
+            self.payloads.append(payload)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EVENT_CODES[code_id] for code_id in self.codes[index]]
+        return EVENT_CODES[self.codes[index]]
+
+    def __iter__(self):
+        return (EVENT_CODES[code_id] for code_id in self.codes)
+
+    def index(self, code, start=0):
+        return self.codes.index(event_id(code), start)
+
+    def first(self, code, since):
+        code_id = event_id(code)
+        for i, timestamp in enumerate(self.timestamps):
+            if self.codes[i] == code_id and timestamp >= since:
+                return timestamp
+        return None
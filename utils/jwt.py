@@ -0,0 +1,24 @@
+import base64
+import json
+
+
+def decode_claims(token):
+    try:
+        payload = token.split('.')[1]
+        return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def user_from_claims(token, username=None, is_guest=None):
+    claims = decode_claims(token)
+    if not isinstance(claims, dict):
+        return None
+    user_id = claims.get('id', claims.get('user_id'))
+    if isinstance(user_id, str) and user_id.isdigit():
+        user_id = int(user_id)
+    username = claims.get('username', username)
+    is_guest = claims.get('is_guest', is_guest)
+    if user_id is None or username is None or is_guest is None:
+        return None
+    return {'id': user_id, 'username': username, 'is_guest': is_guest}
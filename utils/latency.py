@@ -0,0 +1,118 @@
+import atexit
+import math
+import re
+from threading import Lock
+
+from utils.config import LATENCY_REPORT
+
+_BASE = 0.0001
+_GROWTH = 1.05
+
+
+class Histogram:
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+
+    def add(self, value):
+        index = 0 if value <= _BASE else math.ceil(math.log(value / _BASE, _GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p):
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_BASE * _GROWTH ** index, self.max)
+        return self.max
+
+
+class _Entry:
+
+    def __init__(self):
+        self.elapsed = Histogram()
+        self.ttfb = Histogram()
+        self.size = 0
+
+
+_entries = {}
+_deliveries = {}
+_lock = Lock()
+_segment = re.compile(r'^[a-z_\-]+$')
+
+
+def endpoint_template(endpoint):
+    path = endpoint.split('?', 1)[0]
+    return '/'.join(part if not part or _segment.match(part) else '{}' for part in path.split('/'))
+
+
+def record_request(method, endpoint, port, result):
+    key = (method, endpoint_template(endpoint), port)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            entry = _entries[key] = _Entry()
+        entry.elapsed.add(result.elapsed)
+        if result.ttfb is not None:
+            entry.ttfb.add(result.ttfb)
+        entry.size += result.size
+
+
+def record_delivery(event_code, seconds):
+    with _lock:
+        histogram = _deliveries.get(event_code)
+        if histogram is None:
+            histogram = _deliveries[event_code] = Histogram()
+        histogram.add(seconds)
+
+
+def format_table(header, rows):
+    widths = [max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))]
+    return '\n'.join('  '.join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip() for row in [header] + rows)
+
+
+def ms(seconds):
+    return f'{seconds * 1000:.1f}'
+
+
+def histogram_row(histogram):
+    return [histogram.count, ms(histogram.percentile(50)), ms(histogram.percentile(90)), ms(histogram.percentile(99)), ms(histogram.max)]
+
+
+def report():
+    with _lock:
+        items = sorted(_entries.items(), key=lambda item: -item[1].elapsed.total)
+        rows = []
+        for (method, endpoint, port), entry in items:
+            ttfb = ms(entry.ttfb.total / entry.ttfb.count) if entry.ttfb.count else '-'
+            rows.append([method, endpoint, port] + histogram_row(entry.elapsed) + [ttfb, entry.size // entry.elapsed.count])
+    if not rows:
+        return ''
+    header = ['method', 'endpoint', 'port', 'count', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'avg ttfb ms', 'avg bytes']
+    return format_table(header, rows)
+
+
+def delivery_report():
+    with _lock:
+        rows = [[event_code] + histogram_row(histogram) for event_code, histogram in sorted(_deliveries.items())]
+    if not rows:
+        return ''
+    return format_table(['event', 'count', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms'], rows)
+
+
+@atexit.register
+def _report_latency():
+    if LATENCY_REPORT:
+        table = report()
+        if table:
+            print('\nREQUEST LATENCY', table, sep='\n', flush=True)
+        table = delivery_report()
+        if table:
+            print('\nSSE DELIVERY LATENCY', table, sep='\n', flush=True)
@@ -0,0 +1,47 @@
+import threading
+from collections import deque
+
+from utils.config import LOG_LEVEL, LOG_BUFFER_SIZE
+
+QUIET = 'quiet'
+FAILURES = 'failures'
+VERBOSE = 'verbose'
+
+_buffer = deque(maxlen=LOG_BUFFER_SIZE)
+_ignored = threading.local()
+
+
+def _format(fmt, args):
+    if not args:
+        return fmt
+    return fmt % tuple(arg.decode(errors='replace') if isinstance(arg, bytes) else arg for arg in args)
+
+
+def ignore_thread():
+    _ignored.value = True
+
+
+def ignored():
+    return getattr(_ignored, 'value', False)
+
+
+def log(fmt, *args):
+    if LOG_LEVEL == QUIET or ignored():
+        return
+    if LOG_LEVEL == VERBOSE:
+        print(_format(fmt, args), flush=True)
+    else:
+        _buffer.append((fmt, args))
+
+
+def start_test():
+    _buffer.clear()
+
+
+def dump(title):
+    if not _buffer:
+        return
+    lines = [f'----- LOG {title} -----']
+    lines += [_format(fmt, args) for fmt, args in list(_buffer)]
+    _buffer.clear()
+    print('\n'.join(lines), flush=True)
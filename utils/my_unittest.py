@@ -1,21 +1,74 @@
+import atexit
 import json
-import re
+import socket
 import time
 import unittest
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from threading import Thread, Condition, Event, Lock
 
 import httpx
 
 from services.auth import register, create_guest
 from services.game import is_in_game
 from services.user import me
+from utils import trace
+from utils.config import BATCH_WORKERS, JWT_CLAIMS, SSE_CONNECT_TIMEOUT, SSE_HUB, SSE_CHECK_WORKERS, SSE_RECONNECT_ATTEMPTS, SSE_RECONNECT_DELAY, \
+    SSE_RECONNECT_MAX_DELAY, SSE_PAYLOAD_RING, SSE_DENSE_IDS
+from utils.event_log import EventLog
 from utils.generate_random import rnstr
+from utils.jwt import user_from_claims
+from utils.latency import record_delivery
+from utils.log import log, start_test, dump
+from utils.request import http2_enabled, get_http2_client, reset_http2_stream
 from utils.sse_event import du, gs
+from utils.sse_hub import SSE_URL, Subscription, get_hub
+from utils.sse_parser import SSEParser
+from utils.timing import SSE_CONNECT, SSE_WAIT, span, parallel, install
+from utils.user_pool import get_pooled_user
+
+if trace.enabled():
+    install()
+
+_sse_checks = ThreadPoolExecutor(max_workers=SSE_CHECK_WORKERS, thread_name_prefix='sse-check')
+_sse_stats = {'reconnects': 0, 'lost': 0, 'jumps': 0, 'duplicates': 0}
+_sse_stats_lock = Lock()
+
+
+def _count_sse(key, n=1):
+    with _sse_stats_lock:
+        _sse_stats[key] += n
+
+
+@atexit.register
+def _report_sse():
+    if any(_sse_stats.values()):
+        print(f"SSE: {_sse_stats['reconnects']} reconnects, {_sse_stats['lost']} events lost, {_sse_stats['jumps']} id jumps, {_sse_stats['duplicates']} duplicates dropped", flush=True)
 
 
 class UnitTest(unittest.TestCase):
 
+    def run(self, result=None):
+        if result is None:
+            result = self.defaultTestResult()
+        problems = len(result.failures) + len(result.errors)
+        start_test()
+        trace.start_test()
+        try:
+            return super().run(result)
+        finally:
+            trace.save(self.id())
+            if len(result.failures) + len(result.errors) > problems:
+                dump(self.id())
+
     def user(self, tests_sse: list[str] | bool = None, username=None, password=None, guest=False, sse=True, connect_game=True):
+        if username is None and password is None:
+            _new_user = get_pooled_user(guest)
+            if _new_user is not None:
+                if sse:
+                    self.connect_to_sse(_new_user, tests_sse, connect_game=connect_game)
+                return _new_user
+
         _new_user = {}
 
         if guest:
@@ -32,14 +85,29 @@ class UnitTest(unittest.TestCase):
         token = self.assertResponse(response, 201)
         _new_user['token'] = token['access']
         _new_user['refresh'] = token['refresh']
-        response = self.assertResponse(me(_new_user), 200)
-        _new_user['id'] = response['id']
-        _new_user['username'] = response['username']
-        _new_user['is_guest'] = response['is_guest']
+        claims = user_from_claims(_new_user['token'], _new_user.get('username'), guest) if JWT_CLAIMS else None
+        if claims is None:
+            claims = self.assertResponse(me(_new_user), 200)
+        _new_user['id'] = claims['id']
+        _new_user['username'] = claims['username']
+        _new_user['is_guest'] = claims['is_guest']
         if sse:
             self.connect_to_sse(_new_user, tests_sse, connect_game=connect_game)
         return _new_user
 
+    def users(self, n, tests_sse=None, guest=False, sse=True, connect_game=True):
+        if n <= 0:
+            return []
+
+        def _user(i):
+            tests = tests_sse(i) if callable(tests_sse) else tests_sse
+            if isinstance(tests, list):
+                tests = list(tests)
+            return self.user(tests, guest=guest, sse=sse, connect_game=connect_game)
+
+        with parallel() as helpers, ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, n)) as executor:
+            return list(executor.map(helpers.wrap(_user), range(n)))
+
     def assertResponse(self, response, status_code, json_assertion=None, count=None, get_field=None, get_user=False):
         self.assertEqual(status_code, response.status_code)
         if json_assertion is not None:
@@ -63,58 +131,241 @@ class UnitTest(unittest.TestCase):
         return responses[1].json['id']
 
     def connect_to_sse(self, user, tests: list[str] | bool = None, status_code=200, connect_game=True):
-        user['thread'] = Thread(target=self._thread_connect_to_sse, args=(user, tests, status_code, connect_game))
-        user['thread'].start()
-        time.sleep(0.5)
-        return user['thread']
+        with span(SSE_CONNECT):
+            return self._connect_to_sse(user, tests, status_code, connect_game)
 
-    def _thread_connect_to_sse(self, user, tests, status_code, connect_game):
-        user['thread_tests'] = tests
-        user['thread_assertion'] = []
-        user['thread_finish'] = False
+    @staticmethod
+    def _init_sse_user(user, tests):
         if 'username' not in user:
             user['username'] = 'unknown'
-        print(f"SSE CONNECTING {user['username']}...\n", flush=True)
-        with httpx.Client(verify=False) as client:
-            headers = {
-                'Authorization': f'Bearer {user["token"]}',
-                'Content-Type': 'text/event-stream',
-            }
-            with client.stream('GET', 'https://localhost:4443/sse/users/', headers=headers) as response:
-                self.assertEqual(status_code, response.status_code)
-                if status_code == 200:
-                    buff = None
-                    for line in response.iter_text():
-                        if user['thread_finish']:
+        user['thread_tests'] = tests
+        user['thread_assertion'] = EventLog(SSE_PAYLOAD_RING)
+        user['thread_finish'] = Event()
+        user['thread_condition'] = Condition()
+        user['thread_cursor'] = 0
+        user['thread_closed'] = False
+        user['thread_ready'] = Event()
+        user['thread_response'] = None
+        user['thread_parser'] = SSEParser()
+        user['thread_checks'] = []
+        user['thread_attempt'] = 0
+        user['thread_resumed'] = False
+        user['thread_last_id'] = None
+        user['thread_reconnects'] = 0
+        user['thread_lost'] = 0
+        user['thread_jumps'] = 0
+        user['thread_duplicates'] = 0
+
+    def _connect_to_sse(self, user, tests, status_code, connect_game):
+        self._init_sse_user(user, tests)
+        log('SSE CONNECTING %s...\n', user['username'])
+        if SSE_HUB:
+            user['thread'] = get_hub().subscribe(
+                lambda: self._sse_headers(user),
+                lambda response: self._on_sse_open(user, response, status_code),
+                lambda chunk: self._on_sse_chunk(user, chunk, connect_game),
+                lambda: self._on_sse_close(user),
+                lambda: self._sse_reconnect_delay(user),
+            )
+        else:
+            user['thread'] = Thread(target=self._thread_connect_to_sse, args=(user, status_code, connect_game))
+            user['thread'].start()
+        if not user['thread_ready'].wait(SSE_CONNECT_TIMEOUT):
+            self._cancel_sse(user)
+            self.fail(f"SSE for {user['username']} not ready within {SSE_CONNECT_TIMEOUT}s")
+        return user['thread']
+
+    @staticmethod
+    def _sse_headers(user):
+        headers = {
+            'Authorization': f'Bearer {user["token"]}',
+            'Content-Type': 'text/event-stream',
+        }
+        if user['thread_parser'].last_id is not None:
+            headers['Last-Event-ID'] = user['thread_parser'].last_id
+        return headers
+
+    def _thread_connect_to_sse(self, user, status_code, connect_game):
+        try:
+            with nullcontext(get_http2_client()) if http2_enabled() else httpx.Client(verify=False) as client:
+                while True:
+                    try:
+                        if self._sse_stream(client, user, status_code, connect_game):
+                            break
+                    except httpx.HTTPError:
+                        if user['thread_finish'].is_set():
                             break
-                        if buff is not None:
-                            line = buff + line
-                            buff = None
-                        if '\n\n' not in line:
-                            buff = line
-                            continue
-                        for event, data in re.findall(r'event: ([a-z0-9\-]+)\ndata: (.+)\n\n', line):
-                            if event == 'ping':
-                                continue
-                            data = json.loads(data)
-                            print(f"SSE RECEIVED {user['username']}: {data}", flush=True)
-                            if data['event_code'] == gs and connect_game:
-                                self.assertResponse(is_in_game(user, data['data']['id']), 200)
-                            user['thread_assertion'].append(data['event_code'])
-                            if event == du:
-                                break
-        print(f"SSE DISCONNECTING {user['username']}...\n", flush=True)
+                    delay = self._sse_reconnect_delay(user)
+                    if delay is None or user['thread_finish'].wait(delay):
+                        break
+        finally:
+            self._on_sse_close(user)
+
+    def _sse_stream(self, client, user, status_code, connect_game):
+        with client.stream('GET', SSE_URL, headers=self._sse_headers(user)) as response:
+            if not self._on_sse_open(user, response, status_code):
+                return True
+            for chunk in response.iter_bytes():
+                if self._on_sse_chunk(user, chunk, connect_game):
+                    return True
+        return False
+
+    @staticmethod
+    def _sse_reconnect_delay(user):
+        if user['thread_finish'].is_set() or user['thread_attempt'] >= SSE_RECONNECT_ATTEMPTS:
+            return None
+        retry = user['thread_parser'].retry
+        delay = (retry / 1000 if retry is not None else SSE_RECONNECT_DELAY) * 2 ** user['thread_attempt']
+        delay = min(delay, SSE_RECONNECT_MAX_DELAY)
+        user['thread_attempt'] += 1
+        user['thread_reconnects'] += 1
+        user['thread_resumed'] = True
+        user['thread_parser'].reset()
+        _count_sse('reconnects')
+        log('SSE RECONNECTING %s in %.1fs (attempt %s)', user['username'], delay, user['thread_attempt'])
+        return delay
+
+    def _on_sse_open(self, user, response, status_code):
+        user['thread_response'] = response
+        user['thread_ready'].set()
+        if user['thread_resumed'] and response.status_code != 200:
+            log('SSE RECONNECT REFUSED %s: %s', user['username'], response.status_code)
+            return False
+        self.assertEqual(status_code, response.status_code)
+        if status_code == 200:
+            user['thread_attempt'] = 0
+        return status_code == 200
+
+    @staticmethod
+    def _is_duplicate(user, event_id):
+        if event_id is None or not event_id.isdigit():
+            return False
+        event_id = int(event_id)
+        last_id = user['thread_last_id']
+        if last_id is not None and event_id <= last_id:
+            user['thread_duplicates'] += 1
+            _count_sse('duplicates')
+            log('SSE DUPLICATE %s: id %s', user['username'], event_id)
+            return True
+        if user['thread_resumed'] and last_id is not None and event_id > last_id + 1:
+            if SSE_DENSE_IDS:
+                user['thread_lost'] += event_id - last_id - 1
+                _count_sse('lost', event_id - last_id - 1)
+                log('SSE GAP %s: %s events lost after id %s', user['username'], event_id - last_id - 1, last_id)
+            else:
+                user['thread_jumps'] += 1
+                _count_sse('jumps')
+                log('SSE ID JUMP %s: id %s after id %s', user['username'], event_id, last_id)
+        user['thread_resumed'] = False
+        user['thread_last_id'] = event_id
+        return False
+
+    def _on_sse_chunk(self, user, chunk, connect_game):
+        if user['thread_finish'].is_set():
+            return True
+        received_at = time.monotonic()
+        for event, event_id, data, has_id in user['thread_parser'].feed(chunk):
+            if event == 'ping':
+                continue
+            if not has_id:
+                event_id = None
+            elif self._is_duplicate(user, event_id):
+                continue
+            data = json.loads(data)
+            log('SSE RECEIVED %s: %s', user['username'], data)
+            trace.instant(data['event_code'], f"sse {user['username']}", {'id': event_id, 'data': data.get('data')})
+            if data['event_code'] == gs and connect_game:
+                user['thread_checks'].append(_sse_checks.submit(is_in_game, user, data['data']['id']))
+            with user['thread_condition']:
+                user['thread_assertion'].append(data['event_code'], received_at, data)
+                user['thread_condition'].notify_all()
+            if event == du:
+                return True
+        return False
+
+    @staticmethod
+    def _on_sse_close(user):
+        user['thread_ready'].set()
+        log('SSE DISCONNECTING %s...\n', user['username'])
+        with user['thread_condition']:
+            user['thread_closed'] = True
+            user['thread_condition'].notify_all()
+
+    @staticmethod
+    def _cancel_sse(user):
+        user['thread_finish'].set()
+        if isinstance(user['thread'], Subscription):
+            user['thread'].cancel()
+            return
+        response = user['thread_response']
+        if response is None:
+            return
+        if response.http_version == 'HTTP/2':
+            reset_http2_stream(response)
+            return
+        network_stream = response.extensions.get('network_stream')
+        sock = network_stream.get_extra_info('socket') if network_stream is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _find_events(events, start, codes):
+        for code in codes:
+            try:
+                start = events.index(code, start) + 1
+            except ValueError:
+                return None
+        return start
+
+    def wait_for_events(self, user, codes, timeout=10):
+        with span(SSE_WAIT):
+            self._wait_for_events(user, codes, timeout)
+
+    def _wait_for_events(self, user, codes, timeout):
+        with user['thread_condition']:
+            user['thread_condition'].wait_for(
+                lambda: self._find_events(user['thread_assertion'], user['thread_cursor'], codes) is not None or user['thread_closed'],
+                timeout,
+            )
+            end = self._find_events(user['thread_assertion'], user['thread_cursor'], codes)
+            if end is None:
+                self.fail(f"{user['username']} did not receive {codes} within {timeout}s, got {user['thread_assertion'][user['thread_cursor']:]}")
+            user['thread_cursor'] = end
+            checks = list(user['thread_checks'])
+        wait(checks, timeout)
+
+    def delivery(self, trigger, code, *users, timeout=10):
+        latencies = []
+        for user in users:
+            with span(SSE_WAIT), user['thread_condition']:
+                user['thread_condition'].wait_for(
+                    lambda: user['thread_assertion'].first(code, trigger.sent_at) is not None or user['thread_closed'],
+                    timeout,
+                )
+                received_at = user['thread_assertion'].first(code, trigger.sent_at)
+            if received_at is None:
+                self.fail(f"{user['username']} did not receive {code} within {timeout}s of the trigger")
+            latencies.append(received_at - trigger.sent_at)
+            record_delivery(code, latencies[-1])
+        return latencies
 
     def assertThread(self, *users):
         time.sleep(0.1)
+        with span(SSE_CONNECT):
+            for user in users:
+                self._cancel_sse(user)
+            for user in users:
+                user['thread'].join()
         for user in users:
-            user['thread_finish'] = True
-        for user in users:
-            user['thread'].join()
+            for check in user['thread_checks']:
+                self.assertResponse(check.result(), 200)
             if user['thread_tests'] is None:
                 user['thread_tests'] = []
             if user['thread_tests'] is not False:
-                print('TEST', user['id'], user['username'], flush=True)
-                print('expected', user['thread_tests'], flush=True)
-                print('got     ', user['thread_assertion'], flush=True)
-                self.assertListEqual(user['thread_tests'], user['thread_assertion'])
+                log('TEST %s %s', user['id'], user['username'])
+                log('expected %s', user['thread_tests'])
+                log('got      %s', user['thread_assertion'][:])
+                self.assertListEqual(user['thread_tests'], user['thread_assertion'][:])
@@ -1,19 +1,191 @@
+import asyncio
+import atexit
+import functools
+import http.cookiejar
 import json
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from threading import Lock
 from typing import Literal
 
+import httpcore
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils.config import POOL_SIZE, ASYNC_POOL_SIZE, BATCH_WORKERS, HTTP2
+from utils.latency import record_request
+from utils.log import log
+from utils.timing import count_request, http_bucket, parallel, span
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_UNSET = object()
 
 
 class RequestResult:
 
-    def __init__(self, status_code, json_data=None):
+    def __init__(self, status_code, json_data=None, content=None):
         self.status_code = status_code
-        if json_data is None:
+        if json_data is None and content is None:
             json_data = {}
-        self.json = json_data
+        self._json = _UNSET if json_data is None else json_data
+        self._content = content
+        self.elapsed = None
+        self.connect_time = None
+        self.ttfb = None
+        self.size = 0
+        self.sent_at = None
 
+    @property
+    def json(self):
+        if self._json is _UNSET:
+            try:
+                self._json = _loads(self._content)
+            except ValueError:
+                self._json = None
+            self._content = None
+        return self._json
 
-def make_request(endpoint, method='GET', token=None, data=None, port=4443, token_type='Bearer '):
+
+_sessions = {}
+_sessions_lock = Lock()
+_requests_sent = 0
+_closed_connections = 0
+_async_clients = weakref.WeakKeyDictionary()
+_http2 = HTTP2
+_http2_client = None
+_spec_only = ContextVar('_spec_only', default=False)
+
+
+def no_cookies():
+    return http.cookiejar.CookieJar(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _get_session(scheme, host, port):
+    key = (scheme, host, port)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, pool_block=True)
+            session = requests.Session()
+            session.verify = False
+            session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            session.mount(f'{scheme}://{host}:{port}', adapter)
+            _sessions[key] = session
+        return session
+
+
+def _connections(session):
+    connections = 0
+    for adapter in session.adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            connections += pools[pool_key].num_connections
+    return connections
+
+
+def handshakes_avoided():
+    with _sessions_lock:
+        connections = _closed_connections + sum(_connections(session) for session in _sessions.values())
+        return _requests_sent - connections
+
+
+def set_http2(enabled):
+    global _http2
+    _http2 = enabled
+
+
+def http2_enabled():
+    return _http2
+
+
+def get_http2_client():
+    global _http2_client
+    with _sessions_lock:
+        if _http2_client is None:
+            _http2_client = httpx.Client(http2=True, verify=False, timeout=None, cookies=no_cookies(), limits=httpx.Limits(max_connections=POOL_SIZE))
+        return _http2_client
+
+
+def reset_http2_stream(response):
+    from h2.errors import ErrorCodes
+    from h2.events import StreamReset
+    from h2.exceptions import ProtocolError
+
+    stream = response.stream._stream._httpcore_stream._stream
+    connection, stream_id = stream._connection, stream._stream_id
+    events = connection._events.get(stream_id)
+    if events is None:
+        return
+    reset = StreamReset()
+    reset.stream_id, reset.error_code, reset.remote_reset = stream_id, ErrorCodes.CANCEL, False
+    events.append(reset)
+    with connection._write_lock:
+        try:
+            connection._h2_state.reset_stream(stream_id, ErrorCodes.CANCEL)
+            connection._h2_state.ping(b'\0' * 8)
+            connection._network_stream.write(connection._h2_state.data_to_send())
+        except (ProtocolError, httpcore.NetworkError):
+            pass
+
+
+def close_sessions():
+    global _http2_client, _closed_connections
+    with _sessions_lock:
+        for session in _sessions.values():
+            _closed_connections += _connections(session)
+            session.close()
+        _sessions.clear()
+        if _http2_client is not None:
+            _http2_client.close()
+            _http2_client = None
+
+
+@atexit.register
+def _report_pool():
+    if _requests_sent:
+        print(f'POOL: {_requests_sent} requests, {handshakes_avoided()} handshakes avoided', flush=True)
+    close_sessions()
+
+
+def _get_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(verify=False, timeout=None, cookies=no_cookies(), limits=httpx.Limits(max_connections=ASYNC_POOL_SIZE))
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client():
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def request_spec(func, *args, **kwargs):
+    token = _spec_only.set(True)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _spec_only.reset(token)
+
+
+def asynchronous(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await amake_request(**request_spec(func, *args, **kwargs))
+    return wrapper
+
+
+def _prepare(endpoint, token, data, port, token_type):
     if data is not None:
         data = json.dumps(data)
 
@@ -23,23 +195,101 @@ def make_request(endpoint, method='GET', token=None, data=None, port=4443, token
     if token is not None:
         headers['Authorization'] = token_type + token
 
-    r = requests.request(
+    scheme = 'https' if port == 4443 else 'http'
+    return scheme, f'{scheme}://localhost:{port}/api/{endpoint}', headers, data
+
+
+def _trace_timing(events, start):
+    connect_time = None
+    if 'connection.connect_tcp.started' in events:
+        connected = events.get('connection.start_tls.complete', events.get('connection.connect_tcp.complete'))
+        if connected is not None:
+            connect_time = connected - events['connection.connect_tcp.started']
+    for name, timestamp in events.items():
+        if name.endswith('receive_response_headers.complete'):
+            return connect_time, timestamp - start
+    return connect_time, None
+
+
+def _result(method, endpoint, port, data, r, sent_at, elapsed, connect_time=None, ttfb=None):
+    log('%s %s => %s - %s', method, endpoint, r.status_code, data)
+
+    if r.status_code == 204 or r.status_code == 414:
+        result = RequestResult(r.status_code)
+    else:
+        log('JSON => %s\n', r.content)
+        result = RequestResult(r.status_code, content=r.content)
+
+    result.sent_at = sent_at
+    result.elapsed = elapsed
+    result.connect_time = connect_time
+    result.ttfb = ttfb
+    result.size = len(r.content)
+    record_request(method, endpoint, port, result)
+    count_request(elapsed)
+    return result
+
+
+def make_request(endpoint, method='GET', token=None, data=None, port=4443, token_type='Bearer '):
+    if _spec_only.get():
+        return {'endpoint': endpoint, 'method': method, 'token': token, 'data': data, 'port': port, 'token_type': token_type}
+
+    with span(http_bucket(port), f'{method} {endpoint}'):
+        return _send(endpoint, method, token, data, port, token_type)
+
+
+def _send(endpoint, method, token, data, port, token_type):
+    global _requests_sent
+
+    scheme, url, headers, data = _prepare(endpoint, token, data, port, token_type)
+    sent_at = time.monotonic()
+    start = time.perf_counter()
+    if _http2 and port == 4443:
+        events = {}
+        r = get_http2_client().request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=data,
+            extensions={'trace': lambda name, info: events.setdefault(name, time.perf_counter())},
+        )
+        return _result(method, endpoint, port, data, r, sent_at, time.perf_counter() - start, *_trace_timing(events, start))
+
+    session = _get_session(scheme, 'localhost', port)
+    with _sessions_lock:
+        _requests_sent += 1
+    r = session.request(
         method=method,
-        url=f'http{"s" if port == 4443 else ""}://localhost:{port}/api/{endpoint}',
+        url=url,
         headers=headers,
         data=data,
         verify=False,
     )
+    return _result(method, endpoint, port, data, r, sent_at, time.perf_counter() - start, ttfb=r.elapsed.total_seconds())
 
-    print(f'{method} {endpoint} => {r.status_code} - {data}', flush=True)
 
-    if r.status_code == 204 or r.status_code == 414:
-        print()
-        return RequestResult(r.status_code)
+async def amake_request(endpoint, method='GET', token=None, data=None, port=4443, token_type='Bearer '):
+    _, url, headers, data = _prepare(endpoint, token, data, port, token_type)
+    events = {}
 
-    try:
-        result = r.json()
-        print('JSON =>', result, end='\n\n', flush=True)
-        return RequestResult(r.status_code, result)
-    except json.decoder.JSONDecodeError:
-        pass
+    async def trace(name, info):
+        events.setdefault(name, time.perf_counter())
+
+    sent_at = time.monotonic()
+    start = time.perf_counter()
+    r = await _get_async_client().request(
+        method=method,
+        url=url,
+        headers=headers,
+        content=data,
+        extensions={'trace': trace},
+    )
+    return _result(method, endpoint, port, data, r, sent_at, time.perf_counter() - start, *_trace_timing(events, start))
+
+
+def make_requests(specs, max_workers=BATCH_WORKERS):
+    specs = list(specs)
+    if not specs:
+        return []
+    with parallel() as helpers, ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+        return list(executor.map(helpers.wrap(lambda spec: make_request(**spec)), specs))
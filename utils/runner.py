@@ -0,0 +1,264 @@
+import argparse
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import time
+import unittest
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import timing
+from utils.config import RUNNER_JOBS
+from utils.dependency_index import affected, changed_files
+from utils.latency import format_table
+
+OK = 'ok'
+FAIL = 'FAIL'
+ERROR = 'ERROR'
+SKIP = 'skipped'
+EXPECTED_FAILURE = 'expected failure'
+UNEXPECTED_SUCCESS = 'unexpected success'
+
+
+class StreamResult(unittest.TestResult):
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        timing.start_test()
+        self._started[test.id()] = time.perf_counter()
+
+    def _report(self, test, status, detail=None):
+        start = self._started.pop(test.id(), None)
+        duration = time.perf_counter() - start if start is not None else 0.
+        self.events.put(('test', test.id(), status, duration, detail, timing.snapshot()))
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._report(test, OK)
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._report(test, FAIL, self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._report(test, ERROR, self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._report(test, SKIP, reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._report(test, EXPECTED_FAILURE)
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._report(test, UNEXPECTED_SUCCESS)
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            status = FAIL if issubclass(err[0], test.failureException) else ERROR
+            self.events.put(('test', subtest.id(), status, 0., self._exc_info_to_string(err, test), {}))
+
+
+def _init_worker():
+    if not sys.warnoptions:
+        warnings.simplefilter('default')
+    timing.install()
+    sys.stdout = sys.stderr = io.StringIO()
+
+
+def run_class(name, test_ids, events):
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+        suite.run(StreamResult(events))
+    finally:
+        output = sys.stdout.getvalue()
+        sys.stdout.seek(0)
+        sys.stdout.truncate()
+        events.put(('class', name, output))
+
+
+def iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def discover(start_dir, pattern, names=None):
+    classes = {}
+    files = {}
+    broken = []
+    for test in iter_tests(unittest.defaultTestLoader.discover(start_dir, pattern=pattern)):
+        if type(test).__module__ == 'unittest.loader':
+            broken.append(test)
+            continue
+        name = f'{type(test).__module__}.{type(test).__qualname__}'
+        if not names or any(n in name for n in names):
+            classes.setdefault(name, []).append(test.id())
+            files[name] = os.path.relpath(sys.modules[type(test).__module__].__file__)
+    return classes, files, broken
+
+
+def last_failed(classes, failed):
+    selected = {}
+    for name, test_ids in classes.items():
+        test_ids = [test_id for test_id in test_ids if test_id in failed]
+        if test_ids:
+            selected[name] = test_ids
+    return selected
+
+
+class Report:
+
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+        self.counts = {}
+        self.problems = []
+        self.timings = {}
+        self.ran = 0
+
+    def test(self, test_id, status, duration, detail, stats=None):
+        self.ran += 1
+        if stats:
+            self.timings[test_id] = {'wall': duration, 'status': status, **stats}
+        self.counts[status] = self.counts.get(status, 0) + 1
+        if status in (FAIL, ERROR):
+            self.problems.append((status, test_id, detail))
+        suffix = f' ({detail})' if status == SKIP and detail else ''
+        print(f'{test_id} ... {status}{suffix} [{duration:.2f}s]', file=self.stream, flush=True)
+
+    def output(self, name, text):
+        if text.strip():
+            print(f'----- OUTPUT {name} -----', text.rstrip(), sep='\n', file=self.stream, flush=True)
+
+    def summary(self, elapsed):
+        for status, test_id, detail in self.problems:
+            print('=' * 70, f'{status}: {test_id}', '-' * 70, detail.rstrip(), sep='\n', file=self.stream)
+        print('-' * 70, f'Ran {self.ran} tests in {elapsed:.3f}s', '', sep='\n', file=self.stream)
+        details = [f'{key}={self.counts[status]}' for status, key in (
+            (FAIL, 'failures'), (ERROR, 'errors'), (SKIP, 'skipped'),
+            (EXPECTED_FAILURE, 'expected failures'), (UNEXPECTED_SUCCESS, 'unexpected successes'),
+        ) if self.counts.get(status)]
+        print(('OK' if self.succeeded() else 'FAILED') + (f' ({", ".join(details)})' if details else ''), file=self.stream, flush=True)
+
+    def slowest(self, n=20):
+        rows = []
+        for test_id, t in sorted(self.timings.items(), key=lambda item: item[1]['wall'], reverse=True)[:n]:
+            rows.append([test_id, f"{t['wall']:.2f}", f"{t['time'].get(timing.SLEEP, 0.):.2f}", f"{t['network']:.2f}", t['requests']])
+        if rows:
+            print(f'\nSLOWEST {len(rows)} TESTS', format_table(['test', 'wall s', 'sleep s', 'network s', 'requests'], rows), sep='\n', file=self.stream, flush=True)
+
+    def breakdown(self):
+        if not self.timings:
+            return
+        tests = sorted(self.timings.items(), key=lambda item: item[1]['wall'], reverse=True)
+        buckets = {test_id: timing.breakdown(t['wall'], t['time']) for test_id, t in tests}
+        seen = set().union(*buckets.values())
+        http = sorted(bucket for bucket in seen if bucket.startswith(timing.http_bucket('')))
+        columns = [timing.SLEEP] + http + [bucket for bucket in (timing.SSE_CONNECT, timing.SSE_WAIT) if bucket in seen] + [timing.CPU]
+
+        rows = [[test_id, f"{t['wall']:.2f}"] + [f'{buckets[test_id].get(column, 0.):.2f}' for column in columns] for test_id, t in tests]
+        print('\nTIME BREAKDOWN', format_table(['test', 'wall s'] + [f'{column} s' for column in columns], rows), sep='\n', file=self.stream)
+
+        wall = sum(t['wall'] for t in self.timings.values())
+        rows = []
+        for column in columns:
+            seconds = sum(b.get(column, 0.) for b in buckets.values())
+            rows.append([column, f'{seconds:.2f}', f'{100 * seconds / wall:.1f}' if wall else '-'])
+        rows.append(['total', f'{wall:.2f}', '100.0' if wall else '-'])
+        print('\nSUITE TIME BREAKDOWN', format_table(['bucket', 'seconds', '%'], rows), sep='\n', file=self.stream, flush=True)
+
+    def succeeded(self):
+        return not self.problems and not self.counts.get(UNEXPECTED_SUCCESS)
+
+
+def schedule(classes, timings, first=()):
+    known = [t['wall'] for t in timings.values()]
+    default = max(known) if known else 0.
+
+    def cost(name):
+        return sum(timings[test_id]['wall'] if test_id in timings else default for test_id in classes[name])
+
+    return sorted(classes, key=lambda name: (not any(test_id in first for test_id in classes[name]), -cost(name)))
+
+
+def run(classes, broken, jobs, report, timings, first=()):
+    start = time.perf_counter()
+    local = queue.Queue()
+    for test in broken:
+        test.run(StreamResult(local))
+    while not local.empty():
+        report.test(*local.get()[1:])
+
+    os.environ.setdefault('API_LATENCY_REPORT', '0')
+    context = multiprocessing.get_context('spawn')
+    with context.Manager() as manager, ProcessPoolExecutor(max_workers=max(1, min(jobs, len(classes) or 1)), mp_context=context, initializer=_init_worker) as executor:
+        events = manager.Queue()
+        futures = {executor.submit(run_class, name, classes[name], events): name for name in schedule(classes, timings, first)}
+        pending = set(classes)
+        while pending:
+            try:
+                event = events.get(timeout=0.5)
+            except queue.Empty:
+                for future, name in futures.items():
+                    if name in pending and future.done() and future.exception() is not None:
+                        pending.discard(name)
+                        report.test(name, ERROR, 0., repr(future.exception()))
+                continue
+            if event[0] == 'test':
+                report.test(*event[1:])
+            else:
+                pending.discard(event[1])
+                report.output(event[1], event[2])
+    report.summary(time.perf_counter() - start)
+    report.breakdown()
+    report.slowest()
+    timing.save({**timings, **report.timings})
+    return report.succeeded()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m utils.runner', description='Run the test classes in parallel worker processes.')
+    parser.add_argument('names', nargs='*', help='only run test classes whose name contains one of these strings')
+    parser.add_argument('-j', '--jobs', type=int, default=RUNNER_JOBS)
+    parser.add_argument('-s', '--start-directory', default='tests')
+    parser.add_argument('-p', '--pattern', default='test_*.py')
+    parser.add_argument('--trace', metavar='DIR', help='write a Chrome trace-event file per test into DIR')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--lf', '--last-failed', dest='last_failed', action='store_true', help="only rerun last run's failures")
+    mode.add_argument('--ff', '--failed-first', dest='failed_first', action='store_true', help="run last run's failures first")
+    mode.add_argument('--changed', nargs='?', const='HEAD', metavar='REF', help='only run tests importing modules changed since REF (default HEAD)')
+    args = parser.parse_args(argv)
+    if args.trace:
+        os.environ['API_TRACE_DIR'] = args.trace
+
+    classes, files, broken = discover(args.start_directory, args.pattern, args.names)
+    timings = timing.load()
+    failed = {test_id for test_id, t in timings.items() if t.get('status') in (FAIL, ERROR)}
+    if args.last_failed:
+        selected = last_failed(classes, failed)
+        if selected:
+            classes = selected
+        else:
+            print('no failures recorded, running all tests', flush=True)
+    elif args.changed is not None:
+        tests = affected('.', sorted(set(files.values())), changed_files('.', args.changed))
+        classes = {name: test_ids for name, test_ids in classes.items() if files[name] in tests}
+        print(f'{len(classes)} test classes affected by changes since {args.changed}', flush=True)
+    return 0 if run(classes, broken, args.jobs, Report(), timings, failed if args.failed_first else ()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
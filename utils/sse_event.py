@@ -1,3 +1,5 @@
+from threading import Lock
+
 gs = 'game-start'
 
 tj = 'tournament-join'
@@ -30,3 +32,28 @@ rfr = 'receive-friend-request'
 df = 'delete-friend'
 cfr = 'cancel-friend-request'
 rejfr = 'reject-friend-request'
+
+EVENT_CODES = [
+    gs,
+    tj, tl, tsa, ts, tmf, tf, tm,
+    lj, ll, lup, lsg, lm, lb,
+    ic, i1, i3, it,
+    rm,
+    ppu, du,
+    afr, rfr, df, cfr, rejfr,
+]
+EVENT_IDS = {code: i for i, code in enumerate(EVENT_CODES)}
+
+_intern_lock = Lock()
+
+
+def event_id(code):
+    code_id = EVENT_IDS.get(code)
+    if code_id is None:
+        with _intern_lock:
+            code_id = EVENT_IDS.get(code)
+            if code_id is None:
+                code_id = len(EVENT_CODES)
+                EVENT_CODES.append(code)
+                EVENT_IDS[code] = code_id
+    return code_id
@@ -0,0 +1,88 @@
+import asyncio
+import traceback
+from threading import Thread, Event, Lock
+
+import httpx
+
+from utils.config import SSE_CONNECT_TIMEOUT
+from utils.log import log
+from utils.request import http2_enabled, no_cookies
+
+SSE_URL = 'https://localhost:4443/sse/users/'
+
+
+class Subscription:
+
+    def __init__(self, future, done):
+        self._future = future
+        self._done = done
+
+    def cancel(self):
+        self._future.cancel()
+
+    def join(self, timeout=None):
+        self._done.wait(timeout)
+
+    def is_alive(self):
+        return not self._done.is_set()
+
+
+class SSEHub:
+
+    def __init__(self, connect_timeout=SSE_CONNECT_TIMEOUT):
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(
+            verify=False, http2=http2_enabled(), cookies=no_cookies(),
+            timeout=httpx.Timeout(None, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+        )
+        self._thread = Thread(target=self.loop.run_forever, name='sse-hub', daemon=True)
+        self._thread.start()
+
+    def subscribe(self, headers, on_open, on_chunk, on_close, reconnect=None):
+        done = Event()
+        future = asyncio.run_coroutine_threadsafe(self._stream(headers, on_open, on_chunk, on_close, reconnect, done), self.loop)
+        return Subscription(future, done)
+
+    async def _connect(self, headers, on_open, on_chunk):
+        async with self.client.stream('GET', SSE_URL, headers=headers() if callable(headers) else headers) as response:
+            if not on_open(response):
+                return True
+            async for chunk in response.aiter_bytes():
+                if on_chunk(chunk):
+                    return True
+        return False
+
+    async def _stream(self, headers, on_open, on_chunk, on_close, reconnect, done):
+        try:
+            while True:
+                try:
+                    if await self._connect(headers, on_open, on_chunk):
+                        break
+                except httpx.HTTPError:
+                    pass
+                delay = reconnect() if reconnect is not None else None
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            log('SSE HUB ERROR %s', traceback.format_exc())
+        finally:
+            try:
+                on_close()
+            finally:
+                done.set()
+
+
+_hub = None
+_hub_lock = Lock()
+
+
+def get_hub():
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = SSEHub()
+        return _hub
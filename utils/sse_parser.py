@@ -0,0 +1,82 @@
+class SSEParser:
+
+    def __init__(self):
+        self.last_id = None
+        self.retry = None
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._skip_lf = False
+        self._event = None
+        self._data = []
+        self._has_id = False
+
+    def reset(self):
+        self._buffer.clear()
+        self._scanned = 0
+        self._skip_lf = False
+        self._event = None
+        self._data = []
+        self._has_id = False
+
+    def feed(self, chunk):
+        buffer = self._buffer
+        buffer += chunk
+        records = []
+        start = 0
+        if self._skip_lf and buffer:
+            if buffer.startswith(b'\n'):
+                start = 1
+            self._skip_lf = False
+        while True:
+            scan = max(start, self._scanned)
+            end = buffer.find(b'\n', scan)
+            cr = buffer.find(b'\r', scan, len(buffer) if end == -1 else end)
+            if cr != -1:
+                end = cr
+            if end == -1:
+                break
+            line = bytes(buffer[start:end])
+            start = end + 1
+            if cr != -1:
+                if start == len(buffer):
+                    self._skip_lf = True
+                elif buffer.startswith(b'\n', start):
+                    start += 1
+            record = self._line(line)
+            if record is not None:
+                records.append(record)
+        del buffer[:start]
+        self._scanned = len(buffer)
+        return records
+
+    def _line(self, line):
+        if not line:
+            return self._dispatch()
+        if line.startswith(b':'):
+            return None
+        field, _, value = line.partition(b':')
+        if value[:1] == b' ':
+            value = value[1:]
+        if field == b'event':
+            self._event = value.decode()
+        elif field == b'data':
+            self._data.append(value)
+        elif field == b'id':
+            if b'\0' not in value:
+                self.last_id = value.decode()
+                self._has_id = True
+        elif field == b'retry':
+            if value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def _dispatch(self):
+        event = self._event
+        data = self._data
+        has_id = self._has_id
+        self._event = None
+        self._data = []
+        self._has_id = False
+        if not data:
+            return None
+        return event or 'message', self.last_id, b'\n'.join(data).decode(), has_id
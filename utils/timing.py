@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from utils import trace
+from utils.config import TIMINGS_FILE
+from utils.log import ignored
+
+SLEEP = 'sleep'
+SSE_CONNECT = 'sse connect/teardown'
+SSE_WAIT = 'sse wait'
+CPU = 'cpu'
+
+_sleep = time.sleep
+_local = threading.local()
+_lock = threading.Lock()
+_current = {}
+
+
+def start_test():
+    global _current
+    with _lock:
+        _current = {'requests': 0, 'network': 0., 'time': {}}
+    _local.target = _current['time']
+    _local.stack = []
+
+
+def snapshot():
+    with _lock:
+        return {**_current, 'time': dict(_current.get('time', {}))}
+
+
+def count_request(elapsed):
+    if ignored():
+        return
+    with _lock:
+        if _current:
+            _current['requests'] += 1
+            _current['network'] += elapsed
+
+
+def http_bucket(port):
+    return f'http {port}'
+
+
+def _add(target, bucket, seconds):
+    with _lock:
+        target[bucket] = target.get(bucket, 0.) + seconds
+
+
+def _enter():
+    _local.stack.append([time.perf_counter(), 0.])
+
+
+def _exit():
+    start, children = _local.stack.pop()
+    elapsed = time.perf_counter() - start
+    if _local.stack:
+        _local.stack[-1][1] += elapsed
+    return elapsed - children
+
+
+@contextmanager
+def span(bucket, name=None):
+    target = getattr(_local, 'target', None)
+    if target is None and not trace.enabled():
+        yield
+        return
+    start = time.perf_counter()
+    if target is not None:
+        _enter()
+    try:
+        yield
+    finally:
+        if target is not None:
+            _add(target, bucket, _exit())
+        trace.complete(name or bucket, bucket, start, time.perf_counter() - start)
+
+
+class Parallel:
+
+    def __init__(self):
+        self.buckets = {}
+
+    def wrap(self, func):
+        def wrapper(*args, **kwargs):
+            previous = getattr(_local, 'target', None), getattr(_local, 'stack', None)
+            _local.target, _local.stack = self.buckets, []
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _local.target, _local.stack = previous
+        return wrapper
+
+
+@contextmanager
+def parallel():
+    helpers = Parallel()
+    target = getattr(_local, 'target', None)
+    if target is None:
+        yield helpers
+        return
+    _enter()
+    try:
+        yield helpers
+    finally:
+        waited = _exit()
+        with _lock:
+            buckets = dict(helpers.buckets)
+        total = sum(buckets.values())
+        for bucket, seconds in buckets.items():
+            _add(target, bucket, waited * seconds / total)
+
+
+def sleep(seconds):
+    with span(SLEEP):
+        _sleep(seconds)
+
+
+def install():
+    time.sleep = sleep
+
+
+def breakdown(wall, buckets):
+    buckets = dict(buckets)
+    buckets[CPU] = max(0., wall - sum(buckets.values()))
+    return buckets
+
+
+def load(path=TIMINGS_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save(timings, path=TIMINGS_FILE):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
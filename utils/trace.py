@@ -0,0 +1,76 @@
+import json
+import os
+import re
+import threading
+import time
+
+from utils.config import TRACE_DIR
+from utils.log import ignored
+
+_lock = threading.Lock()
+_events = []
+_threads = {}
+_tracks = {}
+_origin = time.perf_counter()
+
+
+def enabled():
+    return bool(TRACE_DIR)
+
+
+def start_test():
+    global _origin
+    with _lock:
+        _events.clear()
+        _threads.clear()
+        _tracks.clear()
+        _origin = time.perf_counter()
+
+
+def _us(timestamp):
+    return (timestamp - _origin) * 1e6
+
+
+def _thread():
+    tid = threading.get_ident()
+    if tid not in _threads:
+        _threads[tid] = threading.current_thread().name
+    return tid
+
+
+def _track(name):
+    if name not in _tracks:
+        _tracks[name] = -(len(_tracks) + 1)
+    return _tracks[name]
+
+
+def complete(name, category, start, duration, args=None):
+    if not TRACE_DIR or ignored():
+        return
+    with _lock:
+        _events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': _us(start), 'dur': duration * 1e6, 'pid': os.getpid(), 'tid': _thread(), 'args': args or {}})
+
+
+def instant(name, track, args=None):
+    if not TRACE_DIR or ignored():
+        return
+    timestamp = time.perf_counter()
+    with _lock:
+        _events.append({'name': name, 'cat': 'sse', 'ph': 'i', 's': 't', 'ts': _us(timestamp), 'pid': os.getpid(), 'tid': _track(track), 'args': args or {}})
+
+
+def save(test_id):
+    if not TRACE_DIR:
+        return None
+    pid = os.getpid()
+    with _lock:
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': test_id}}]
+        events += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}} for tid, name in _threads.items()]
+        events += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}} for name, tid in _tracks.items()]
+        events += _events
+        _events.clear()
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    path = os.path.join(TRACE_DIR, re.sub(r'[^\w.-]', '_', test_id) + '.json')
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return path
@@ -0,0 +1,83 @@
+import time
+from queue import Queue, Empty
+from threading import Thread, Lock
+
+from services.auth import register, create_guest
+from services.user import me
+from utils.config import JWT_CLAIMS, USER_POOL_SIZE, USER_POOL_WORKERS, USER_POOL_MAX_AGE
+from utils.generate_random import rnstr
+from utils.jwt import user_from_claims
+from utils.log import log, ignore_thread
+
+
+def create_identity(guest=False):
+    user = {}
+    if guest:
+        response = create_guest()
+    else:
+        user['username'] = 'user-' + rnstr(10)
+        user['password'] = 'password-' + rnstr(15)
+        response = register(user['username'], user['password'])
+    if response.status_code != 201:
+        return None
+    user['token'] = response.json['access']
+    user['refresh'] = response.json['refresh']
+    claims = user_from_claims(user['token'], user.get('username'), guest) if JWT_CLAIMS else None
+    if claims is None:
+        response = me(user)
+        if response.status_code != 200:
+            return None
+        claims = response.json
+    user['id'] = claims['id']
+    user['username'] = claims['username']
+    user['is_guest'] = claims['is_guest']
+    return user
+
+
+class UserPool:
+
+    def __init__(self, guest, size=USER_POOL_SIZE, workers=USER_POOL_WORKERS):
+        self.guest = guest
+        self.queue = Queue(maxsize=size)
+        self.workers = [Thread(target=self._fill, name=f'user-pool-{"guest" if guest else "user"}', daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def _fill(self):
+        ignore_thread()
+        delay = 0.1
+        while True:
+            try:
+                user = create_identity(self.guest)
+            except Exception as e:
+                log('USER POOL ERROR %s', e)
+                user = None
+            if user is None:
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+                continue
+            delay = 0.1
+            self.queue.put((time.monotonic(), user))
+
+    def get(self):
+        while True:
+            try:
+                created_at, user = self.queue.get_nowait()
+            except Empty:
+                return None
+            if time.monotonic() - created_at <= USER_POOL_MAX_AGE:
+                return user
+
+
+_pools = {}
+_pools_lock = Lock()
+
+
+def get_pooled_user(guest=False):
+    if USER_POOL_SIZE <= 0:
+        return None
+    with _pools_lock:
+        pool = _pools.get(guest)
+        if pool is None:
+            pool = _pools[guest] = UserPool(guest)
+    return pool.get()